@@ -0,0 +1,176 @@
+"""Snapshot caching for the Cardmarket API client."""
+from __future__ import annotations
+
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..models import PriceEntry, WatchItem
+from .client import CardmarketClient
+
+
+@dataclass(slots=True)
+class CachedSnapshot:
+    """Snapshot stored in a ``SnapshotCache`` together with its freshness."""
+
+    fresh_until: float
+    entries: list[PriceEntry]
+
+
+class SnapshotCache(ABC):
+    """Key/value store with expiry used to share snapshots between callers.
+
+    The interface mirrors the handful of Redis commands the memoizer needs
+    (``GET``, ``SET EX``, ``SET NX EX`` and ``DEL``) so a shared backend can be
+    plugged in for multi-process deployments.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        """Return the value stored under ``key`` or ``None`` when missing."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        """Store ``value`` under ``key`` for ``ttl_seconds``."""
+
+    @abstractmethod
+    def add(self, key: str, value: Any, ttl_seconds: float) -> bool:
+        """Store ``value`` only if ``key`` is absent; return whether it was stored."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove ``key`` if present."""
+
+
+class InMemorySnapshotCache(SnapshotCache):
+    """Process-local ``SnapshotCache`` used when no shared backend is configured."""
+
+    def __init__(self) -> None:
+        self._values: dict[str, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            stored = self._values.get(key)
+            if stored is None:
+                return None
+            expires_at, value = stored
+            if expires_at <= time.monotonic():
+                del self._values[key]
+                return None
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        with self._lock:
+            self._values[key] = (time.monotonic() + ttl_seconds, value)
+
+    def add(self, key: str, value: Any, ttl_seconds: float) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            stored = self._values.get(key)
+            if stored is not None and stored[0] > now:
+                return False
+            self._values[key] = (now + ttl_seconds, value)
+            return True
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._values.pop(key, None)
+
+
+class LocalSnapshotCache:
+    """Bounded, process-local LRU of snapshots that expire after ``ttl_seconds``.
+
+    Used as the first cache tier so hot lookups avoid the round trip to a
+    shared ``SnapshotCache``.  Its TTL should stay below the shared tier's to
+    bound staleness.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 60.0) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._values: OrderedDict[str, tuple[float, list[PriceEntry]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> list[PriceEntry] | None:
+        with self._lock:
+            stored = self._values.get(key)
+            if stored is None:
+                return None
+            if stored[0] <= time.monotonic():
+                del self._values[key]
+                return None
+            self._values.move_to_end(key)
+            return stored[1]
+
+    def set(self, key: str, entries: list[PriceEntry], ttl_seconds: float | None = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._values[key] = (time.monotonic() + ttl, entries)
+            self._values.move_to_end(key)
+            while len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+
+
+@dataclass(slots=True)
+class CachedCardmarketClient(CardmarketClient):
+    """``CardmarketClient`` that memoizes product snapshots in a ``SnapshotCache``.
+
+    Snapshots stay fresh for ``ttl_seconds`` (with random jitter so keys do not
+    expire together) and are kept for another TTL as a stale copy.  When a
+    snapshot goes stale a short-lived lock ensures only one caller refreshes it
+    while the others keep serving the stale copy.  Fresh snapshots are also
+    kept in ``local_cache``, which is consulted before the shared ``cache``.
+    """
+
+    cache: SnapshotCache = field(default_factory=InMemorySnapshotCache)
+    local_cache: LocalSnapshotCache = field(default_factory=LocalSnapshotCache)
+    ttl_seconds: float = 720.0
+    ttl_jitter: float = 0.1
+    lock_seconds: float = 5.0
+
+    @staticmethod
+    def cache_key(watch_item: WatchItem) -> str:
+        """Return the cache key identifying ``watch_item``'s API request."""
+
+        filters = watch_item.filters
+        return (
+            f"cm:v1:snapshot:{watch_item.product_id}:{filters.language}:"
+            f"{filters.condition}:{filters.min_quantity}"
+        )
+
+    def fetch_product_snapshot(self, watch_item: WatchItem) -> list[PriceEntry]:
+        """Return a cached snapshot for ``watch_item``, refreshing it when stale."""
+
+        key = self.cache_key(watch_item)
+        local = self.local_cache.get(key)
+        if local is not None:
+            return list(local)
+
+        cached: CachedSnapshot | None = self.cache.get(key)
+        if cached is not None and cached.fresh_until > time.time():
+            self.local_cache.set(key, cached.entries, cached.fresh_until - time.time())
+            return list(cached.entries)
+
+        lock_key = f"{key}:lock"
+        if not self.cache.add(lock_key, True, self.lock_seconds):
+            if cached is not None:
+                return list(cached.entries)
+            return CardmarketClient.fetch_product_snapshot(self, watch_item)
+
+        try:
+            entries = CardmarketClient.fetch_product_snapshot(self, watch_item)
+            if entries:
+                ttl = self.ttl_seconds * random.uniform(1 - self.ttl_jitter, 1 + self.ttl_jitter)
+                snapshot = list(entries)
+                self.cache.set(key, CachedSnapshot(time.time() + ttl, snapshot), ttl * 2)
+                self.local_cache.set(key, snapshot, ttl)
+        finally:
+            self.cache.delete(lock_key)
+        return entries
@@ -1,14 +1,77 @@
 """Client for interacting with the Cardmarket API."""
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
-from dataclasses import dataclass
+import json
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from operator import attrgetter
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from ..models import PriceEntry, WatchItem
+from ..models import PriceEntry, ProductFilter, WatchItem
+
+try:  # pragma: no cover - exercised only when the optional dependency is installed
+    import orjson
+except ImportError:  # pragma: no cover - fallback for minimal installs
+    orjson = None
+
+# Both decoders accept the raw ``bytes`` body and raise ``ValueError``
+# subclasses on malformed input, so callers can treat them interchangeably.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+ArticleMatcher = Callable[[Mapping[str, Any]], bool]
+
+
+def _language_matcher(language: str) -> ArticleMatcher:
+    def matches(article: Mapping[str, Any]) -> bool:
+        language_info = article.get("language", {})
+        if isinstance(language_info, Mapping):
+            return (
+                str(language_info.get("abbreviation", "")).lower() == language
+                or str(language_info.get("languageName", "")).lower() == language
+            )
+        return str(language_info).lower() == language
+
+    return matches
+
+
+def _condition_matcher(condition: str) -> ArticleMatcher:
+    def matches(article: Mapping[str, Any]) -> bool:
+        condition_value = article.get("condition")
+        return condition_value is not None and str(condition_value).lower() == condition
+
+    return matches
+
+
+def _compile_matcher(filters: ProductFilter) -> ArticleMatcher | None:
+    """Build a language/condition matcher specialised for ``filters``.
+
+    Only the checks ``filters`` actually requires end up in the returned
+    closure; ``None`` means every article matches.
+    """
+
+    language_matches = _language_matcher(filters.language.lower()) if filters.language else None
+    condition_matches = _condition_matcher(filters.condition.lower()) if filters.condition else None
+    if language_matches is not None and condition_matches is not None:
+        return lambda article: language_matches(article) and condition_matches(article)
+    return language_matches or condition_matches
+
+
+def _mappings_in(candidate: Any) -> Iterator[Mapping[str, Any]]:
+    """Yield ``candidate`` or its mapping items, ignoring anything else."""
+
+    if isinstance(candidate, Mapping):
+        yield candidate
+    elif isinstance(candidate, list):
+        for item in candidate:
+            if isinstance(item, Mapping):
+                yield item
 
 
 @dataclass(slots=True)
@@ -22,6 +85,31 @@ class CardmarketClient:
     api_base_url: str
     app_token: str
     app_secret: str
+    max_concurrent_requests: int = 4
+    _session: requests.Session = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """Build the shared HTTP session used for every API call.
+
+        Reusing one session keeps TCP/TLS connections alive between polling
+        runs instead of paying the handshake cost for each request.  Auth
+        headers are not stored on the session: OAuth 1.0a signs every request
+        with a fresh nonce and timestamp, so ``build_headers`` runs per call.
+        """
+
+        pool_size = max(self.max_concurrent_requests, 1)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size * 2,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def build_headers(self) -> dict[str, str]:
         """Return HTTP headers required for the Cardmarket API.
@@ -47,6 +135,9 @@ class CardmarketClient:
         tests and with the API occasionally returning malformed payloads.  Any
         network error or unexpected data structure results in an empty snapshot
         rather than raising – keeping the polling loop resilient.
+
+        The body is decoded straight from ``response.content`` (bytes) with
+        ``orjson`` when it is installed, falling back to the standard library.
         """
 
         endpoint = f"{self.api_base_url.rstrip('/')}/products/{watch_item.product_id}/articles"
@@ -57,112 +148,82 @@ class CardmarketClient:
             params["condition"] = watch_item.filters.condition
 
         try:
-            response = requests.get(
+            response = self._session.get(
                 endpoint,
                 headers=self.build_headers(),
                 params=params,
                 timeout=10,
             )
             response.raise_for_status()
-            payload = response.json()
+            payload = _json_loads(response.content)
         except (requests.RequestException, ValueError):
             return []
 
-        articles = self._extract_articles(payload)
-        if not articles:
-            return []
-
         fetched_at = datetime.now(UTC)
+        matcher = _compile_matcher(watch_item.filters)
+        min_quantity = max(watch_item.filters.min_quantity, 1)
         entries: list[PriceEntry] = []
-        for article in articles:
-            if not self._matches_filters(article, watch_item):
-                continue
-
-            price = self._extract_price(article)
-            quantity = self._extract_quantity(article)
-            if price is None or quantity <= 0:
-                continue
-
-            seller = self._extract_seller(article)
-            entries.append(
-                PriceEntry(
-                    fetched_at=fetched_at,
-                    price_eur=price,
-                    available_quantity=quantity,
-                    seller=seller,
-                )
-            )
+        for article in self._iter_articles(payload):
+            entry = self._parse_article(article, matcher, min_quantity, fetched_at)
+            if entry is not None:
+                entries.append(entry)
 
-        entries.sort(key=lambda entry: entry.price_eur)
+        entries.sort(key=attrgetter("price_eur"))
         return entries
 
-    def _extract_articles(self, payload: Any) -> list[Mapping[str, Any]]:
-        """Normalise the variable article containers used by the API.
+    def _iter_articles(self, payload: Any) -> Iterator[Mapping[str, Any]]:
+        """Yield articles from the variable containers used by the API.
 
         Cardmarket historically exposed either ``{"article": [...]}`` or
         ``{"articles": {"article": [...]}}`` depending on the endpoint.  The
         helper accepts both forms (including the degenerate single-dict case)
-        and filters out non-mapping entries so the caller can iterate safely.
+        and skips non-mapping entries so the caller can iterate safely.
+        Articles are yielded lazily rather than copied into a new list.
         """
 
         if not isinstance(payload, Mapping):
-            return []
-
-        articles: list[Mapping[str, Any]] = []
-
-        def _collect(candidate: Any) -> None:
-            if isinstance(candidate, Mapping):
-                articles.append(candidate)
-            elif isinstance(candidate, list):
-                for item in candidate:
-                    if isinstance(item, Mapping):
-                        articles.append(item)
+            return
 
         if "article" in payload:
-            _collect(payload["article"])
+            yield from _mappings_in(payload["article"])
 
         articles_container = payload.get("articles")
         if isinstance(articles_container, Mapping) and "article" in articles_container:
-            _collect(articles_container["article"])
+            yield from _mappings_in(articles_container["article"])
         elif isinstance(articles_container, list):
             for item in articles_container:
-                _collect(item)
-
-        return articles
-
-    def _matches_filters(self, article: Mapping[str, Any], watch_item: WatchItem) -> bool:
-        """Return ``True`` when ``article`` matches the watch list filters."""
-
-        filters = watch_item.filters
-
-        language = filters.language
-        if language:
-            language_info = article.get("language", {})
-            if isinstance(language_info, Mapping):
-                lang_candidates = {
-                    str(language_info.get("abbreviation", "")).lower(),
-                    str(language_info.get("languageName", "")).lower(),
-                }
-            else:
-                lang_candidates = {str(language_info).lower()}
-
-            if language.lower() not in lang_candidates:
-                return False
-
-        condition = filters.condition
-        if condition:
-            condition_value = article.get("condition")
-            if condition_value is None:
-                return False
-            if str(condition_value).lower() != condition.lower():
-                return False
-
-        min_quantity = max(filters.min_quantity, 1)
+                yield from _mappings_in(item)
+
+    def _parse_article(
+        self,
+        article: Mapping[str, Any],
+        matcher: ArticleMatcher | None,
+        min_quantity: int,
+        fetched_at: datetime,
+    ) -> PriceEntry | None:
+        """Return the ``PriceEntry`` for ``article`` or ``None`` when it is rejected.
+
+        Filters, quantity and price are evaluated in one pass so every field is
+        extracted at most once per article.
+        """
+
+        if matcher is not None and not matcher(article):
+            return None
+
         quantity = self._extract_quantity(article)
         if quantity < min_quantity:
-            return False
+            return None
+
+        price = self._extract_price(article)
+        if price is None:
+            return None
 
-        return True
+        return PriceEntry(
+            fetched_at=fetched_at,
+            price_eur=price,
+            available_quantity=quantity,
+            seller=self._extract_seller(article),
+        )
 
     @staticmethod
     def _extract_price(article: Mapping[str, Any]) -> float | None:
@@ -204,18 +265,33 @@ class CardmarketClient:
         return None
 
     def fetch_bulk_snapshots(self, watch_items: Iterable[WatchItem]) -> dict[str, list[PriceEntry]]:
-        """Fetch price snapshots for multiple watch items efficiently."""
+        """Fetch price snapshots for multiple watch items efficiently.
+
+        The requests are I/O bound, so they are issued concurrently from a
+        small thread pool capped at ``max_concurrent_requests`` to respect the
+        API rate limits.  Results keep the order of ``watch_items``.
+
+        Snapshots are keyed by product id, so when several items share a
+        product only the last one's result would be kept; each product is
+        therefore requested once, with the filters of that last item.
+        """
+
+        items = list({item.product_id: item for item in watch_items}.values())
+        workers = min(self.max_concurrent_requests, len(items))
+        if workers <= 1:
+            return {item.product_id: self.fetch_product_snapshot(item) for item in items}
 
         snapshots: dict[str, list[PriceEntry]] = {}
-        for item in watch_items:
-            snapshots[item.product_id] = self.fetch_product_snapshot(item)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cardmarket-fetch") as executor:
+            for item, entries in zip(items, executor.map(self.fetch_product_snapshot, items)):
+                snapshots[item.product_id] = entries
         return snapshots
 
     def health_check(self) -> dict[str, Any]:
         """Perform a lightweight request to ensure the API is reachable."""
 
         try:
-            response = requests.get(self.api_base_url, timeout=5)
+            response = self._session.get(self.api_base_url, timeout=5)
             response.raise_for_status()
             return {"ok": True, "checked_at": datetime.now(UTC)}
         except requests.RequestException as exc:  # pragma: no cover - placeholder
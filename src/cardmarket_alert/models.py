@@ -42,7 +42,10 @@ class WatchItem:
     product_name: str
     filters: ProductFilter
     history: PriceHistory = field(default_factory=lambda: PriceHistory(product_id=""))
+    name_sort_key: str = field(init=False, repr=False, compare=False)
+    """Lower-cased ``product_name`` used to order the watch list."""
 
     def __post_init__(self) -> None:
+        self.name_sort_key = self.product_name.lower()
         if not self.history.product_id:
             self.history.product_id = self.product_id
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 import threading
+import time
 from collections.abc import Callable
 from typing import Iterable
 
@@ -12,32 +13,43 @@ logger = logging.getLogger(__name__)
 
 
 class PollingScheduler:
-    """A lightweight scheduler for periodic polling tasks."""
+    """A lightweight scheduler for periodic polling tasks.
 
-    def __init__(self, interval_seconds: int, task: Callable[[Iterable[WatchItem]], None]) -> None:
+    A single long-lived daemon thread waits on a stop event between runs, so
+    no thread is created or torn down per tick.  Ticks are aligned to the
+    monotonic clock, so the period does not drift by the task's duration.
+    """
+
+    def __init__(self, interval_seconds: float, task: Callable[[Iterable[WatchItem]], None]) -> None:
         self._interval = interval_seconds
         self._task = task
-        self._timer: threading.Timer | None = None
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
         self._watch_items: list[WatchItem] = []
         self._lock = threading.Lock()
-        self._running = False
 
     def start(self, watch_items: Iterable[WatchItem]) -> None:
         """Start scheduling polling runs."""
 
         with self._lock:
             self._watch_items = list(watch_items)
-            self._running = True
-            self._schedule_next()
+            if self._thread is not None:
+                return
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(
+                target=self._poll_loop,
+                args=(self._stop_event,),
+                name="polling-scheduler",
+                daemon=True,
+            )
+            self._thread.start()
 
     def stop(self) -> None:
         """Stop the scheduler."""
 
         with self._lock:
-            self._running = False
-            if self._timer is not None:
-                self._timer.cancel()
-                self._timer = None
+            self._stop_event.set()
+            self._thread = None
 
     def update_watch_items(self, watch_items: Iterable[WatchItem]) -> None:
         """Update the watch items without interrupting the schedule."""
@@ -45,16 +57,29 @@ class PollingScheduler:
         with self._lock:
             self._watch_items = list(watch_items)
 
-    def _schedule_next(self) -> None:
-        if not self._running:
-            return
-        self._timer = threading.Timer(self._interval, self._run_task)
-        self._timer.daemon = True
-        self._timer.start()
+    def _poll_loop(self, stop_event: threading.Event) -> None:
+        next_tick = time.monotonic() + self._interval
+        while not stop_event.wait(max(0.0, next_tick - time.monotonic())):
+            self._run_task()
+            next_tick = self._next_tick(next_tick, time.monotonic())
+
+    def _next_tick(self, previous_tick: float, now: float) -> float:
+        """Return the first tick after ``now`` on the fixed-rate schedule.
+
+        Ticks missed while a slow run was in progress are skipped rather than
+        fired back to back.
+        """
+
+        next_tick = previous_tick + self._interval
+        if next_tick <= now:
+            next_tick += ((now - next_tick) // self._interval + 1) * self._interval
+        return next_tick
 
     def _run_task(self) -> None:
+        with self._lock:
+            watch_items = self._watch_items
         try:
-            logger.debug("Running scheduled polling task for %s items", len(self._watch_items))
-            self._task(self._watch_items)
-        finally:
-            self._schedule_next()
+            logger.debug("Running scheduled polling task for %s items", len(watch_items))
+            self._task(watch_items)
+        except Exception:  # pragma: no cover - keep polling after unexpected failures
+            logger.exception("Scheduled polling task failed")
@@ -1,15 +1,17 @@
 """Coordinates polling, persistence, and alerting for price data."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Iterable
 
 from ..api.client import CardmarketClient
 from ..models import PriceEntry, WatchItem
 from ..notifications.base import Notifier, PriceAlert
-from ..storage.repository import CsvPriceRepository
+from ..storage.base import ExportFile, PriceRepository
+from .snapshot_index import WatchlistSnapshotIndex
 
 
 @dataclass(slots=True)
@@ -17,8 +19,18 @@ class PricingService:
     """High-level service responsible for persisting price snapshots."""
 
     client: CardmarketClient
-    repository: CsvPriceRepository
+    repository: PriceRepository
     notifier: Notifier
+    snapshot_index: WatchlistSnapshotIndex = field(init=False, repr=False)
+    _exports_cache: tuple[list[ExportFile], list[dict[str, object]]] | None = field(
+        default=None, init=False, repr=False
+    )
+    _export_dict_cache: dict[tuple[str, int, int], dict[str, object]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        self.snapshot_index = WatchlistSnapshotIndex(self.repository)
 
     def poll_watch_items(self, watch_items: Iterable[WatchItem]) -> None:
         """Fetch and store price snapshots for each watch item."""
@@ -34,7 +46,14 @@ class PricingService:
             if not entries:
                 continue
 
-            previous_entry = self.repository.latest_entry(watch_item)
+            previous_entry = min(
+                self.repository.latest_snapshot(watch_item),
+                key=attrgetter("price_eur"),
+                default=None,
+            )
+            if previous_entry is not None and entries[0].fetched_at <= previous_entry.fetched_at:
+                # Cached snapshot that has already been persisted.
+                continue
             self.repository.append_entries(watch_item, entries)
             alert = self._detect_price_movement(watch_item, entries, previous_entry)
             if alert is not None:
@@ -44,23 +63,13 @@ class PricingService:
             self.notifier.send(alerts)
 
     def watchlist_snapshot(self, watch_items: Iterable[WatchItem]) -> list[dict[str, object]]:
-        """Summarise repository data for the provided watch list."""
-
-        snapshot: list[dict[str, object]] = []
-        for watch_item in watch_items:
-            latest_entry = self.repository.latest_entry(watch_item)
-            entry_count = self.repository.entry_count(watch_item)
-            snapshot.append(
-                {
-                    "item": watch_item,
-                    "latest_entry": latest_entry,
-                    "latest_price": latest_entry.price_eur if latest_entry else None,
-                    "last_updated": latest_entry.fetched_at if latest_entry else None,
-                    "has_history": entry_count > 0,
-                    "entry_count": entry_count,
-                }
-            )
-        return snapshot
+        """Summarise repository data for the provided watch list.
+
+        Summaries come from ``snapshot_index``, which is updated as entries are
+        appended, so no CSV files are read here.
+        """
+
+        return self.snapshot_index.snapshot(watch_items)
 
     def history_for(self, watch_item: WatchItem) -> list[PriceEntry]:
         """Return stored price history for ``watch_item``."""
@@ -68,25 +77,40 @@ class PricingService:
         return self.repository.load_history(watch_item)
 
     def export_snapshot(self) -> list[dict[str, object]]:
-        """Metadata describing available CSV exports."""
+        """Metadata describing available CSV exports.
+
+        The result is reused for as long as the repository returns the same
+        cached export listing.
+        """
+
+        listing = self.repository.list_export_files()
+        cached = self._exports_cache
+        if cached is not None and cached[0] is listing:
+            return list(cached[1])
 
+        # Per-file metadata is kept across listings, keyed on name, mtime and
+        # size, so unchanged exports are not rebuilt when another one changes.
+        previous = self._export_dict_cache
+        current: dict[tuple[str, int, int], dict[str, object]] = {}
         exports: list[dict[str, object]] = []
-        for export_path in self.repository.list_exports():
-            try:
-                stats = export_path.stat()
-            except FileNotFoundError:
-                continue
-            exports.append(
-                {
+        for export_file in listing:
+            export_path = export_file.path
+            key = (export_path.name, export_file.mtime_ns, export_file.size)
+            export = previous.get(key)
+            if export is None:
+                export = {
                     "id": export_path.stem,
                     "path": export_path,
                     "filename": export_path.name,
-                    "modified": datetime.fromtimestamp(stats.st_mtime, tz=UTC),
-                    "size_kb": round(stats.st_size / 1024, 1),
+                    "modified": datetime.fromtimestamp(export_file.mtime_ns / 1e9, tz=UTC),
+                    "size_kb": round(export_file.size / 1024, 1),
                 }
-            )
+            current[key] = export
+            exports.append(export)
+        self._export_dict_cache = current
         exports.sort(key=lambda export: export["modified"], reverse=True)
-        return exports
+        self._exports_cache = (listing, exports)
+        return list(exports)
 
     def export_watch_item(self, watch_item: WatchItem, destination: Path | None = None) -> Path:
         """Export CSV data for ``watch_item`` to ``destination``."""
@@ -99,12 +123,17 @@ class PricingService:
         entries: list[PriceEntry],
         previous_entry: PriceEntry | None = None,
     ) -> PriceAlert | None:
-        """Generate a ``PriceAlert`` when the latest snapshot is noteworthy."""
+        """Generate a ``PriceAlert`` when the latest snapshot is noteworthy.
+
+        ``entries`` are sorted by price as returned by the client, so the
+        cheapest listing is compared against ``previous_entry``, the cheapest
+        listing of the previous snapshot.
+        """
 
         if not entries:
             return None
 
-        latest = entries[-1]
+        latest = entries[0]
 
         if previous_entry is None:
             message = (
@@ -0,0 +1,152 @@
+"""Write-time index of the per-item watchlist summaries shown in the UI."""
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import attrgetter
+from typing import Iterable
+
+from ..models import PriceEntry, WatchItem
+from ..storage.base import PriceRepository
+
+_MAX_BUILD_WORKERS = 32
+_price = attrgetter("price_eur")
+
+
+def _snapshot_for_item(repository: PriceRepository, watch_item: WatchItem) -> dict[str, object]:
+    """Build the summary record for ``watch_item`` from ``repository``.
+
+    ``latest_entry`` is the cheapest listing of the most recent snapshot, the
+    same listing price alerts compare against.
+    """
+
+    _, entry_count, latest_snapshot = repository.stat_meta(watch_item)
+    latest_entry = min(latest_snapshot, key=_price, default=None)
+    return {
+        "item": watch_item,
+        "latest_entry": latest_entry,
+        "latest_price": latest_entry.price_eur if latest_entry else None,
+        "last_updated": latest_entry.fetched_at if latest_entry else None,
+        "has_history": entry_count > 0,
+        "entry_count": entry_count,
+    }
+
+
+class WatchlistSnapshotIndex:
+    """Keeps one summary record per watch item up to date as data is written.
+
+    Records are built once from the repository when an item is first seen and
+    then updated by ``record_append`` whenever the repository appends entries,
+    so rendering the watchlist needs no CSV I/O.
+    """
+
+    def __init__(self, repository: PriceRepository) -> None:
+        self._repository = repository
+        self._records: dict[str, dict[str, object]] = {}
+        # Appends seen per product, so a record built while an append landed
+        # can be detected and rebuilt instead of stored stale.
+        self._appends: dict[str, int] = {}
+        # Removals seen per product (and clears overall), so a record built
+        # while its item was removed is dropped instead of stored.
+        self._removals: dict[str, int] = {}
+        self._clears = 0
+        self._lock = threading.Lock()
+        repository.add_append_listener(self.record_append)
+
+    def add(self, watch_item: WatchItem) -> None:
+        """Track ``watch_item``, replacing any existing record for its product."""
+
+        self._index([watch_item])
+
+    def remove(self, product_id: str) -> None:
+        """Stop tracking ``product_id``."""
+
+        with self._lock:
+            self._records.pop(product_id, None)
+            self._removals[product_id] = self._removals.get(product_id, 0) + 1
+
+    def clear(self) -> None:
+        """Drop every record."""
+
+        with self._lock:
+            self._records.clear()
+            self._clears += 1
+
+    def record_append(self, watch_item: WatchItem, entries: list[PriceEntry]) -> None:
+        """Update the record for ``watch_item`` after ``entries`` were stored."""
+
+        if not entries:
+            return
+        latest_entry = min(entries, key=_price)
+        with self._lock:
+            self._appends[watch_item.product_id] = self._appends.get(watch_item.product_id, 0) + 1
+            record = self._records.get(watch_item.product_id)
+            if record is None:
+                return
+            entry_count = int(record["entry_count"]) + len(entries)
+            record.update(
+                latest_entry=latest_entry,
+                latest_price=latest_entry.price_eur,
+                last_updated=entries[-1].fetched_at,
+                has_history=True,
+                entry_count=entry_count,
+            )
+
+    def snapshot(self, watch_items: Iterable[WatchItem]) -> list[dict[str, object]]:
+        """Return copies of the records for ``watch_items``, in the given order.
+
+        Items without a record yet (or whose ``WatchItem`` was replaced) are
+        indexed on the fly; several such items are read from the repository
+        concurrently so their file I/O overlaps.
+        """
+
+        items = list(watch_items)
+        with self._lock:
+            missing = [
+                watch_item
+                for watch_item in items
+                if (record := self._records.get(watch_item.product_id)) is None or record["item"] is not watch_item
+            ]
+
+        if missing:
+            self._index(missing)
+
+        with self._lock:
+            # Items removed while their records were being built are skipped.
+            return [
+                dict(record)
+                for watch_item in items
+                if (record := self._records.get(watch_item.product_id)) is not None
+            ]
+
+    def _index(self, watch_items: list[WatchItem]) -> None:
+        """Build and store records for ``watch_items``.
+
+        Records are built without holding the lock.  An append landing
+        meanwhile finds no record to update, so items whose append counter
+        moved during their build are built again.  Items removed (or cleared)
+        during their build are not stored.
+        """
+
+        while watch_items:
+            with self._lock:
+                clears = self._clears
+                versions = [self._appends.get(watch_item.product_id, 0) for watch_item in watch_items]
+                removals = [self._removals.get(watch_item.product_id, 0) for watch_item in watch_items]
+            build = partial(_snapshot_for_item, self._repository)
+            if len(watch_items) == 1:
+                built = [build(watch_items[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=min(_MAX_BUILD_WORKERS, len(watch_items))) as executor:
+                    built = list(executor.map(build, watch_items))
+            stale: list[WatchItem] = []
+            with self._lock:
+                for watch_item, version, removed, record in zip(watch_items, versions, removals, built):
+                    if self._clears != clears or self._removals.get(watch_item.product_id, 0) != removed:
+                        continue
+                    if self._appends.get(watch_item.product_id, 0) != version:
+                        stale.append(watch_item)
+                    else:
+                        self._records[watch_item.product_id] = record
+            watch_items = stale
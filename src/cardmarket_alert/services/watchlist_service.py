@@ -1,10 +1,15 @@
 """Service for managing the watch list."""
 from __future__ import annotations
 
+import bisect
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Iterable
 
 from ..models import ProductFilter, WatchItem
+from .snapshot_index import WatchlistSnapshotIndex
+
+_name_sort_key = attrgetter("name_sort_key")
 
 
 @dataclass(slots=True)
@@ -12,18 +17,43 @@ class WatchlistService:
     """Manages the in-memory watch list of products."""
 
     items: dict[str, WatchItem] = field(default_factory=dict)
+    """Watch items by product id; change them via the methods to keep the sorted view."""
+    snapshot_index: WatchlistSnapshotIndex | None = None
+    _sorted_items: list[WatchItem] = field(init=False, repr=False)
+    """``items`` ordered by ``name_sort_key``, kept in sync on every change."""
+
+    def __post_init__(self) -> None:
+        self._sorted_items = sorted(self.items.values(), key=_name_sort_key)
 
     def add_item(self, product_id: str, product_name: str, filters: ProductFilter) -> WatchItem:
         watch_item = WatchItem(product_id=product_id, product_name=product_name, filters=filters)
+        previous = self.items.get(product_id)
+        if previous is not None:
+            self._discard_sorted(previous)
         self.items[product_id] = watch_item
+        bisect.insort(self._sorted_items, watch_item, key=_name_sort_key)
+        if self.snapshot_index is not None:
+            self.snapshot_index.add(watch_item)
         return watch_item
 
     def remove_item(self, product_id: str) -> None:
-        self.items.pop(product_id, None)
+        watch_item = self.items.pop(product_id, None)
+        if watch_item is not None:
+            self._discard_sorted(watch_item)
+        if self.snapshot_index is not None:
+            self.snapshot_index.remove(product_id)
 
     def all_items(self) -> list[WatchItem]:
         return list(self.items.values())
 
+    def all_items_sorted(self) -> tuple[WatchItem, ...]:
+        """Return the watch items ordered by name.
+
+        The order is maintained incrementally, so no sort happens here.
+        """
+
+        return tuple(self._sorted_items)
+
     def update_filters(self, product_id: str, filters: ProductFilter) -> None:
         if product_id not in self.items:
             raise KeyError(f"Unknown product: {product_id}")
@@ -31,3 +61,18 @@ class WatchlistService:
 
     def load(self, items: Iterable[WatchItem]) -> None:
         self.items = {item.product_id: item for item in items}
+        self._sorted_items = sorted(self.items.values(), key=_name_sort_key)
+        if self.snapshot_index is not None:
+            self.snapshot_index.clear()
+            for item in self.items.values():
+                self.snapshot_index.add(item)
+
+    def _discard_sorted(self, watch_item: WatchItem) -> None:
+        sorted_items = self._sorted_items
+        key = watch_item.name_sort_key
+        position = bisect.bisect_left(sorted_items, key, key=_name_sort_key)
+        while position < len(sorted_items) and sorted_items[position].name_sort_key == key:
+            if sorted_items[position] is watch_item:
+                del sorted_items[position]
+                return
+            position += 1
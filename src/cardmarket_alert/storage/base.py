@@ -0,0 +1,99 @@
+"""Storage abstractions for captured price data."""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterable
+
+from ..models import PriceEntry, WatchItem
+
+AppendListener = Callable[[WatchItem, list[PriceEntry]], None]
+
+
+@dataclass(slots=True)
+class ExportFile:
+    """A downloadable CSV export together with its size and modification time."""
+
+    path: Path
+    size: int
+    mtime_ns: int
+
+
+class PriceRepository(ABC):
+    """Base class for backends that persist price snapshots per watch item.
+
+    Services depend only on this interface, so a backend with a different
+    on-disk format can replace ``CsvPriceRepository`` without further changes.
+    Exports are always CSV files so users can download them.
+    """
+
+    def __init__(self) -> None:
+        self._append_listeners: list[AppendListener] = []
+
+    def add_append_listener(self, listener: AppendListener) -> None:
+        """Call ``listener(watch_item, entries)`` after every ``append_entries``."""
+
+        self._append_listeners.append(listener)
+
+    def _notify_append(self, watch_item: WatchItem, entries: list[PriceEntry]) -> None:
+        """Run the append listeners; backends call this after storing ``entries``."""
+
+        for listener in self._append_listeners:
+            listener(watch_item, entries)
+
+    @abstractmethod
+    def append_entries(self, watch_item: WatchItem, entries: Iterable[PriceEntry]) -> None:
+        """Append price entries to the history of ``watch_item``."""
+
+    @abstractmethod
+    def latest_entry(self, watch_item: WatchItem) -> PriceEntry | None:
+        """Return the most recent ``PriceEntry`` for ``watch_item``."""
+
+    @abstractmethod
+    def load_history(self, watch_item: WatchItem, limit: int | None = None) -> list[PriceEntry]:
+        """Load stored entries for ``watch_item`` in chronological order.
+
+        When ``limit`` is provided the newest ``limit`` entries are returned.
+        """
+
+    @abstractmethod
+    def entry_count(self, watch_item: WatchItem) -> int:
+        """Return the number of stored entries for ``watch_item``."""
+
+    @abstractmethod
+    def stat_meta(self, watch_item: WatchItem) -> tuple[bool, int, list[PriceEntry]]:
+        """Return ``(exists, entry_count, latest_snapshot)`` for ``watch_item``."""
+
+    @abstractmethod
+    def export(self, watch_item: WatchItem, destination: Path | None = None) -> Path:
+        """Write a downloadable CSV of ``watch_item``'s history and return its path."""
+
+    @abstractmethod
+    def list_export_files(self) -> list[ExportFile]:
+        """List the exported CSV files, ordered by path."""
+
+    def list_exports(self) -> list[Path]:
+        """List all exported CSV files."""
+
+        return [export.path for export in self.list_export_files()]
+
+    def latest_snapshot(self, watch_item: WatchItem) -> list[PriceEntry]:
+        """Return the entries stored by the most recent snapshot of ``watch_item``."""
+
+        history = self.load_history(watch_item)
+        if not history:
+            return []
+
+        fetched_at = history[-1].fetched_at
+        start = len(history) - 1
+        while start > 0 and history[start - 1].fetched_at == fetched_at:
+            start -= 1
+        return history[start:]
+
+    def last_updated(self, watch_item: WatchItem) -> datetime | None:
+        """Return the timestamp of the last appended entry."""
+
+        latest = self.latest_entry(watch_item)
+        return latest.fetched_at if latest else None
@@ -2,22 +2,258 @@
 from __future__ import annotations
 
 import csv
-from dataclasses import asdict
+import os
+import shutil
+import threading
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 from ..models import PriceEntry, WatchItem
+from .base import ExportFile, PriceRepository
 
+_HEADER = ("fetched_at", "price_eur", "available_quantity", "seller")
+_WRITE_BUFFER_SIZE = 1 << 16
 
-class CsvPriceRepository:
+
+def _read_last_line(file_path: Path, block_size: int = 4096) -> bytes:
+    """Return the last non-empty line of ``file_path`` by reading from its end."""
+
+    with file_path.open("rb") as handle:
+        position = handle.seek(0, os.SEEK_END)
+        tail = b""
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            handle.seek(position)
+            tail = handle.read(read_size) + tail
+            stripped = tail.rstrip(b"\r\n")
+            newline = stripped.rfind(b"\n")
+            if newline != -1:
+                return stripped[newline + 1 :]
+        return tail.rstrip(b"\r\n")
+
+
+def _read_last_snapshot(file_path: Path, block_size: int = 4096) -> list[PriceEntry]:
+    """Return the trailing rows of ``file_path`` that share the last row's ``fetched_at``.
+
+    Blocks are read backwards from the end of the file (doubling in size)
+    until a row with a different timestamp, or the header, precedes the last
+    snapshot, so the rest of the file is never parsed.  Raises ``ValueError``
+    when the tail cannot be split into rows safely (e.g. a quoted newline).
+    """
+
+    with file_path.open("rb") as handle:
+        position = handle.seek(0, os.SEEK_END)
+        tail = b""
+        while True:
+            if position > 0:
+                read_size = min(block_size, position)
+                position -= read_size
+                handle.seek(position)
+                tail = handle.read(read_size) + tail
+                block_size *= 2
+                first_newline = tail.find(b"\n")
+                if first_newline == -1:
+                    continue
+                # The first line may be cut off unless the file start was reached.
+                lines = tail[first_newline + 1 :].splitlines() if position > 0 else tail.splitlines()
+            else:
+                lines = tail.splitlines()
+            lines = [line for line in lines if line]
+            if not lines:
+                if position > 0:
+                    continue
+                return []
+
+            timestamp = lines[-1].split(b",", 1)[0]
+            start = len(lines) - 1
+            while start > 0 and lines[start - 1].split(b",", 1)[0] == timestamp:
+                start -= 1
+            if start == 0 and position > 0:
+                continue
+            if start > 0:
+                boundary = lines[start - 1].split(b",", 1)[0]
+                if boundary != b"fetched_at":
+                    datetime.fromisoformat(boundary.decode("utf-8"))  # not a row fragment
+            rows = csv.reader([line.decode("utf-8") for line in lines[start:]])
+            return [_parse_row(row) for row in rows if row != list(_HEADER)]
+
+
+def _in_quotes_after(line: bytes, in_quotes: bool) -> bool:
+    """Return whether a quoted field is still open at the end of ``line``.
+
+    Follows ``csv.reader``: a quote only opens a field at the start of the
+    line or right after a comma, ``""`` inside a quoted field is an escaped
+    quote, and stray quotes inside unquoted fields are literal.
+    """
+
+    position = 0
+    while True:
+        if in_quotes:
+            quote = line.find(b'"', position)
+            if quote == -1:
+                return True
+            if line[quote + 1 : quote + 2] == b'"':
+                position = quote + 2
+                continue
+            in_quotes = False
+            position = quote + 1
+        else:
+            if position == 0 and line.startswith(b'"'):
+                opening = 0
+            else:
+                opening = line.find(b',"', position)
+                if opening == -1:
+                    return False
+                opening += 1
+            in_quotes = True
+            position = opening + 1
+
+
+def _count_lines(file_path: Path, chunk_size: int = 1 << 20) -> int:
+    """Count the CSV records of ``file_path`` by scanning raw bytes for newlines.
+
+    A single reusable buffer is filled with ``readinto`` so no new ``bytes``
+    object is allocated per chunk.  Chunks without a quote byte are counted
+    with ``bytearray.count``.  Quoted fields (e.g. a seller containing a
+    newline) can span lines, so otherwise the chunk is split into lines and
+    a newline only ends a record when no quoted field is open, as tracked by
+    ``_in_quotes_after``.  The unfinished last line of each chunk is carried
+    into the next one.
+    """
+
+    newline = ord("\n")
+    count = 0
+    last_byte = newline
+    in_quotes = False
+    pending = b""
+    buffer = bytearray(chunk_size)
+    with file_path.open("rb", buffering=0) as handle:
+        while read := handle.readinto(buffer):
+            last_byte = buffer[read - 1]
+            if not in_quotes and b'"' not in pending and buffer.find(b'"', 0, read) == -1:
+                count += buffer.count(b"\n", 0, read)
+                last_newline = buffer.rfind(b"\n", 0, read)
+                if last_newline == -1:
+                    pending += bytes(memoryview(buffer)[:read])
+                else:
+                    pending = bytes(memoryview(buffer)[last_newline + 1 : read])
+                continue
+            *lines, pending = (pending + bytes(memoryview(buffer)[:read])).split(b"\n")
+            for line in lines:
+                in_quotes = _in_quotes_after(line, in_quotes)
+                if not in_quotes:
+                    count += 1
+    if last_byte != newline:
+        count += 1
+    return count
+
+
+def _sanitize(value: str) -> str:
+    """Quote ``value`` the way ``csv.writer`` does when it needs quoting."""
+
+    if "," in value or '"' in value or "\n" in value or "\r" in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _csv_lines(entries: Iterable[PriceEntry]) -> Iterator[str]:
+    """Yield CSV lines for ``entries`` in ``_HEADER`` order.
+
+    Lines are formatted directly rather than through ``csv.writer``; only the
+    seller can need quoting, which ``_sanitize`` handles.  Entries from one
+    snapshot share the same ``fetched_at`` object, so the timestamp is only
+    formatted when it changes.
+    """
+
+    fetched_at: datetime | None = None
+    timestamp = ""
+    for entry in entries:
+        if entry.fetched_at is not fetched_at:
+            fetched_at = entry.fetched_at
+            timestamp = fetched_at.isoformat()
+        seller = _sanitize(entry.seller) if entry.seller else ""
+        yield f"{timestamp},{entry.price_eur!r},{entry.available_quantity},{seller}\r\n"
+
+
+def _parse_row(row: list[str]) -> PriceEntry:
+    """Build a ``PriceEntry`` from a CSV data row in ``_HEADER`` order."""
+
+    return PriceEntry(
+        fetched_at=datetime.fromisoformat(row[0]),
+        price_eur=float(row[1]),
+        available_quantity=int(row[2]),
+        seller=(row[3] if len(row) > 3 else "") or None,
+    )
+
+
+def _snapshot_of(entries: list[PriceEntry]) -> list[PriceEntry]:
+    """Return the trailing ``entries`` that share the last entry's ``fetched_at``."""
+
+    if not entries:
+        return []
+    fetched_at = entries[-1].fetched_at
+    start = len(entries) - 1
+    while start > 0 and entries[start - 1].fetched_at == fetched_at:
+        start -= 1
+    return entries[start:]
+
+
+def _extend_snapshot(snapshot: list[PriceEntry], appended: list[PriceEntry]) -> list[PriceEntry]:
+    """Return the latest snapshot after ``appended`` followed ``snapshot``."""
+
+    latest = _snapshot_of(appended)
+    if len(latest) == len(appended) and snapshot and snapshot[-1].fetched_at == latest[-1].fetched_at:
+        return snapshot + latest
+    return latest
+
+
+@dataclass(slots=True)
+class _CachedFile:
+    """Parsed state of a CSV file, valid while its mtime and size are unchanged.
+
+    ``mtime_ns`` and ``size`` never change after construction: appends replace
+    the entry in the cache, so a value computed from an older entry can be
+    rejected by checking that the entry is still the cached one.
+    """
+
+    mtime_ns: int
+    size: int
+    history: list[PriceEntry] | None = None
+    latest: PriceEntry | None = None
+    snapshot: list[PriceEntry] | None = None
+    row_count: int | None = None
+
+
+def _stat_key(file_path: Path) -> tuple[int, int] | None:
+    try:
+        stats = file_path.stat()
+    except FileNotFoundError:
+        return None
+    return stats.st_mtime_ns, stats.st_size
+
+
+class CsvPriceRepository(PriceRepository):
     """Persists price snapshots to CSV files."""
 
     def __init__(self, base_path: Path, export_path: Path | None = None) -> None:
+        super().__init__()
         self._base_path = base_path
         self._export_path = export_path or (base_path / "exports")
         self._base_path.mkdir(parents=True, exist_ok=True)
         self._export_path.mkdir(parents=True, exist_ok=True)
+        # Parsed history and summaries per CSV, keyed by path and validated
+        # against the file's mtime/size so unchanged files are never re-read.
+        self._file_cache: dict[Path, _CachedFile] = {}
+        # Guards ``_file_cache`` and appends.  File reads happen outside it; their
+        # results are stored through ``_fill`` only if the file is unchanged.
+        self._lock = threading.Lock()
+        # Export listing (with each file's stat) keyed on the export
+        # directory's mtime.
+        self._exports_cache: tuple[int, list[ExportFile]] | None = None
 
     def _file_for(self, watch_item: WatchItem) -> Path:
         safe_id = watch_item.product_id.replace("/", "_")
@@ -28,103 +264,278 @@ class CsvPriceRepository:
 
         return self._file_for(watch_item)
 
+    def _cached_file(self, file_path: Path) -> _CachedFile | None:
+        """Return the cache entry for ``file_path`` or ``None`` if it does not exist."""
+
+        with self._lock:
+            key = _stat_key(file_path)
+            if key is None:
+                self._file_cache.pop(file_path, None)
+                return None
+
+            cached = self._file_cache.get(file_path)
+            if cached is None or (cached.mtime_ns, cached.size) != key:
+                cached = _CachedFile(mtime_ns=key[0], size=key[1])
+                self._file_cache[file_path] = cached
+            return cached
+
+    def _fill(self, file_path: Path, cached: _CachedFile, **values: object) -> None:
+        """Store lazily computed ``values`` on ``cached`` if it is still current.
+
+        The values were read from the file without holding the lock, so they
+        are dropped when an append replaced ``cached`` or the file changed
+        on disk in the meantime.
+        """
+
+        with self._lock:
+            if self._file_cache.get(file_path) is cached and _stat_key(file_path) == (cached.mtime_ns, cached.size):
+                for name, value in values.items():
+                    setattr(cached, name, value)
+
     def append_entries(self, watch_item: WatchItem, entries: Iterable[PriceEntry]) -> None:
         """Append price entries to the CSV file for the watch item."""
 
+        entries = list(entries)
         file_path = self._file_for(watch_item)
-        is_new_file = not file_path.exists()
-        with file_path.open("a", encoding="utf-8", newline="") as handle:
-            writer = csv.writer(handle)
+        with self._lock:
+            # One stat both validates the cache and tells whether the file still
+            # needs its header row (it may have been deleted since the last append).
+            key = _stat_key(file_path)
+            is_new_file = key is None or key[1] == 0
+            cached = self._file_cache.get(file_path)
+            if cached is not None and (cached.mtime_ns, cached.size) != key:
+                cached = None
+            # A 64 KiB buffer lets a whole snapshot reach the OS in few write calls.
+            with file_path.open("a", buffering=_WRITE_BUFFER_SIZE, encoding="utf-8", newline="") as handle:
+                if is_new_file:
+                    csv.writer(handle).writerow(_HEADER)
+                handle.write("".join(_csv_lines(entries)))
+
             if is_new_file:
-                writer.writerow(["fetched_at", "price_eur", "available_quantity", "seller"])
-            for entry in entries:
-                row = asdict(entry)
-                writer.writerow(
-                    [
-                        entry.fetched_at.isoformat(),
-                        row.get("price_eur", ""),
-                        row.get("available_quantity", ""),
-                        row.get("seller", ""),
-                    ]
-                )
+                cached = _CachedFile(mtime_ns=0, size=0, history=[], row_count=0)
+            if cached is None:
+                self._file_cache.pop(file_path, None)
+            else:
+                self._advance_cache(file_path, cached, entries)
+
+        self._notify_append(watch_item, entries)
+
+    def _advance_cache(self, file_path: Path, cached: _CachedFile, entries: list[PriceEntry]) -> None:
+        """Replace ``cached`` with an entry covering ``entries`` appended to ``file_path``.
+
+        Must be called with the lock held.
+        """
+
+        key = _stat_key(file_path)
+        if key is None:  # pragma: no cover - file removed concurrently
+            self._file_cache.pop(file_path, None)
+            return
+        stored = [
+            entry if entry.seller != "" else PriceEntry(entry.fetched_at, entry.price_eur, entry.available_quantity)
+            for entry in entries
+        ]
+        snapshot = cached.snapshot
+        if stored and snapshot is not None:
+            snapshot = _extend_snapshot(snapshot, stored)
+        advanced = _CachedFile(
+            mtime_ns=key[0],
+            size=key[1],
+            history=cached.history,
+            latest=stored[-1] if stored else cached.latest,
+            snapshot=snapshot,
+            row_count=cached.row_count + len(stored) if cached.row_count is not None else None,
+        )
+        if advanced.history is not None:
+            advanced.history.extend(stored)
+        self._file_cache[file_path] = advanced
 
     def latest_entry(self, watch_item: WatchItem) -> PriceEntry | None:
         """Return the most recent ``PriceEntry`` for ``watch_item``."""
 
-        history = self.load_history(watch_item, limit=1)
-        return history[0] if history else None
+        file_path = self._file_for(watch_item)
+        cached = self._cached_file(file_path)
+        return self._latest_from(file_path, cached) if cached is not None else None
+
+    def _latest_from(self, file_path: Path, cached: _CachedFile) -> PriceEntry | None:
+        if cached.latest is not None:
+            return cached.latest
+        history = cached.history
+        if history is None:
+            try:
+                last_line = _read_last_line(file_path)
+                latest = _parse_row(next(csv.reader([last_line.decode("utf-8")])))
+            except (StopIteration, IndexError, UnicodeDecodeError, ValueError):
+                history = self._parse_history(file_path)
+                self._fill(file_path, cached, history=history)
+            else:
+                self._fill(file_path, cached, latest=latest)
+                return latest
+        return history[-1] if history else None
 
     def load_history(self, watch_item: WatchItem, limit: int | None = None) -> list[PriceEntry]:
         """Load stored ``PriceEntry`` objects for ``watch_item``.
 
         Entries are returned in chronological order. When ``limit`` is provided the
-        newest ``limit`` entries are returned.
+        newest ``limit`` entries are returned, so ``limit <= 0`` yields none.
         """
 
+        if limit is not None and limit <= 0:
+            return []
         file_path = self._file_for(watch_item)
-        if not file_path.exists():
+        cached = self._cached_file(file_path)
+        if cached is None:
             return []
+        entries = cached.history
+        if entries is None:
+            if limit is not None:
+                # Keep only the tail while streaming instead of caching it all.
+                return self._parse_history(file_path, limit)
+            entries = self._parse_history(file_path)
+            self._fill(file_path, cached, history=entries)
+
+        if limit is None or limit >= len(entries):
+            return entries[:]
+
+        return entries[-limit:]
 
-        entries: list[PriceEntry] = []
+    def _parse_history(self, file_path: Path, limit: int | None = None) -> list[PriceEntry]:
+        """Parse the valid rows of ``file_path``, skipping malformed ones.
+
+        With ``limit`` only the newest ``limit`` entries are retained while
+        reading, so memory stays proportional to ``limit``.
+        """
+
+        # Bind the per-row callables to locals to avoid repeated global and
+        # attribute lookups in the hot loop.
+        parse_timestamp = datetime.fromisoformat
+        to_float = float
+        to_int = int
+        entries: deque[PriceEntry] | list[PriceEntry] = deque(maxlen=limit) if limit is not None else []
+        append = entries.append
         with file_path.open("r", encoding="utf-8", newline="") as handle:
-            reader = csv.DictReader(handle)
-            for row in reader:
+            for row in csv.DictReader(handle):
                 try:
-                    fetched_at = datetime.fromisoformat(row["fetched_at"])
-                    price = float(row["price_eur"])
-                    quantity = int(row["available_quantity"])
-                    seller = row.get("seller") or None
+                    append(
+                        PriceEntry(
+                            fetched_at=parse_timestamp(row["fetched_at"]),
+                            price_eur=to_float(row["price_eur"]),
+                            available_quantity=to_int(row["available_quantity"]),
+                            seller=row.get("seller") or None,
+                        )
+                    )
                 except (KeyError, TypeError, ValueError):
                     continue
-                entries.append(
-                    PriceEntry(
-                        fetched_at=fetched_at,
-                        price_eur=price,
-                        available_quantity=quantity,
-                        seller=seller,
-                    )
-                )
+        return list(entries)
 
-        if limit is None or limit >= len(entries):
-            return entries
+    def latest_snapshot(self, watch_item: WatchItem) -> list[PriceEntry]:
+        """Return the entries stored by the most recent snapshot of ``watch_item``.
 
-        return entries[-limit:]
+        The snapshot is read from the end of the file and cached, so polling
+        does not load the full history.
+        """
+
+        file_path = self._file_for(watch_item)
+        cached = self._cached_file(file_path)
+        return self._snapshot_from(file_path, cached) if cached is not None else []
+
+    def _snapshot_from(self, file_path: Path, cached: _CachedFile) -> list[PriceEntry]:
+        snapshot = cached.snapshot
+        if snapshot is None:
+            if cached.history is not None:
+                snapshot = _snapshot_of(cached.history)
+            else:
+                try:
+                    snapshot = _read_last_snapshot(file_path)
+                except (IndexError, UnicodeDecodeError, ValueError):
+                    snapshot = _snapshot_of(self._parse_history(file_path))
+            self._fill(file_path, cached, snapshot=snapshot)
+        return snapshot[:]
 
     def entry_count(self, watch_item: WatchItem) -> int:
         """Return the number of stored entries for ``watch_item``."""
 
         file_path = self._file_for(watch_item)
-        if not file_path.exists():
-            return 0
+        cached = self._cached_file(file_path)
+        return self._row_count_from(file_path, cached) if cached is not None else 0
 
-        with file_path.open("r", encoding="utf-8", newline="") as handle:
-            reader = csv.reader(handle)
-            next(reader, None)  # skip header
-            return sum(1 for _ in reader)
+    def _row_count_from(self, file_path: Path, cached: _CachedFile) -> int:
+        row_count = cached.row_count
+        if row_count is None:
+            row_count = max(_count_lines(file_path) - 1, 0)  # minus header
+            self._fill(file_path, cached, row_count=row_count)
+        return row_count
+
+    def stat_meta(self, watch_item: WatchItem) -> tuple[bool, int, list[PriceEntry]]:
+        """Return ``(exists, entry_count, latest_snapshot)`` for ``watch_item``.
+
+        All three values come from one ``stat`` call and the file cache, so
+        summaries need no further filesystem checks per item.
+        """
+
+        file_path = self._file_for(watch_item)
+        cached = self._cached_file(file_path)
+        if cached is None:
+            return False, 0, []
+        return True, self._row_count_from(file_path, cached), self._snapshot_from(file_path, cached)
 
     def export(self, watch_item: WatchItem, destination: Path | None = None) -> Path:
         """Copy the CSV for a watch item to a new location.
 
         When ``destination`` is omitted the CSV is copied into the repository's
-        export directory.
+        export directory.  The copy is skipped when the target already has the
+        source's size and is at least as new.
         """
 
         source = self._file_for(watch_item)
-        if not source.exists():
+        source_key = _stat_key(source)
+        if source_key is None:
             raise FileNotFoundError(f"No history stored for {watch_item.product_id}")
 
         target = destination or (self._export_path / source.name)
+        target_key = _stat_key(target)
+        if target_key is not None and target_key[1] == source_key[1] and target_key[0] >= source_key[0]:
+            # The copy is newer than the source and the same size: up to date.
+            return target
+
         target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_bytes(source.read_bytes())
+        shutil.copyfile(source, target)
+        self._exports_cache = None
         return target
 
-    def list_exports(self) -> list[Path]:
-        """List all stored CSV files."""
+    def list_export_files(self) -> list[ExportFile]:
+        """List exported CSV files with their size and modification time.
 
-        return sorted(self._export_path.glob("*.csv"))
+        A single ``os.scandir`` pass collects names and stats.  The listing is
+        cached until the export directory's mtime changes or ``export``
+        writes a file, so the same list object is returned while nothing
+        changed.  Callers must not mutate it.
+        """
 
-    def last_updated(self, watch_item: WatchItem) -> datetime | None:
-        """Return the timestamp of the last appended entry."""
+        try:
+            stamp = self._export_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            # The export directory was removed while the app was running.
+            self._exports_cache = None
+            return []
+        cached = self._exports_cache
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
 
-        latest = self.latest_entry(watch_item)
-        return latest.fetched_at if latest else None
+        exports: list[ExportFile] = []
+        try:
+            with os.scandir(self._export_path) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".csv"):
+                        continue
+                    try:
+                        if entry.is_file():
+                            stats = entry.stat()
+                            exports.append(ExportFile(Path(entry.path), stats.st_size, stats.st_mtime_ns))
+                    except FileNotFoundError:
+                        continue
+        except FileNotFoundError:
+            self._exports_cache = None
+            return []
+        exports.sort(key=lambda export: export.path)
+        self._exports_cache = (stamp, exports)
+        return exports
@@ -1,6 +1,7 @@
 """Flask web application serving the user interface."""
 from __future__ import annotations
 
+import time
 from datetime import UTC, datetime
 from typing import Any
 
@@ -12,7 +13,9 @@ from ..notifications.base import PopupNotifier
 from ..services.pricing_service import PricingService
 from ..services.watchlist_service import WatchlistService
 from ..storage.repository import CsvPriceRepository
-from ..api.client import CardmarketClient
+from ..api.cache import CachedCardmarketClient
+
+_YEAR_REFRESH_SECONDS = 3600.0
 
 
 def create_app(pricing_service: PricingService, watchlist_service: WatchlistService) -> Flask:
@@ -22,9 +25,20 @@ def create_app(pricing_service: PricingService, watchlist_service: WatchlistServ
     app.config["pricing_service"] = pricing_service
     app.config["watchlist_service"] = watchlist_service
 
+    # The footer year is computed once and refreshed at most hourly instead of
+    # on every rendered template.
+    current_year: dict[str, Any] = {"value": datetime.now(UTC).year, "checked_at": time.monotonic()}
+
+    @app.before_request
+    def refresh_current_year() -> None:
+        now = time.monotonic()
+        if now - current_year["checked_at"] > _YEAR_REFRESH_SECONDS:
+            current_year["value"] = datetime.now(UTC).year
+            current_year["checked_at"] = now
+
     @app.context_processor
     def inject_globals() -> dict[str, Any]:
-        return {"current_year": datetime.now(UTC).year}
+        return {"current_year": current_year["value"]}
 
     @app.route("/")
     def index() -> str:
@@ -48,8 +62,7 @@ def create_app(pricing_service: PricingService, watchlist_service: WatchlistServ
 
     @app.route("/watchlist")
     def watchlist() -> str:
-        watchlist_snapshot = pricing_service.watchlist_snapshot(watchlist_service.all_items())
-        watchlist_snapshot.sort(key=lambda entry: entry["item"].product_name.lower())
+        watchlist_snapshot = pricing_service.watchlist_snapshot(watchlist_service.all_items_sorted())
         return render_template("watchlist.html", watchlist=watchlist_snapshot)
 
     @app.route("/watchlist/<product_id>")
@@ -111,7 +124,18 @@ def bootstrap_app() -> tuple[Flask, PricingService, WatchlistService]:
     config = DEFAULT_CONFIG
     config.ensure_data_directories()
     repository = CsvPriceRepository(config.data_directory)
-    watchlist_service = WatchlistService()
+    pricing_service = PricingService(
+        client=CachedCardmarketClient(
+            api_base_url="https://api.cardmarket.com/ws/v2.0/output.json",
+            app_token="",
+            app_secret="",
+            max_concurrent_requests=config.polling.max_concurrent_requests,
+            ttl_seconds=config.polling.interval_seconds * 0.8,
+        ),
+        repository=repository,
+        notifier=PopupNotifier(),
+    )
+    watchlist_service = WatchlistService(snapshot_index=pricing_service.snapshot_index)
     dummy_item = watchlist_service.add_item(
         product_id="demo-blue-eyes",
         product_name="Blue-Eyes White Dragon",
@@ -122,11 +146,6 @@ def bootstrap_app() -> tuple[Flask, PricingService, WatchlistService]:
             min_quantity=1,
         ),
     )
-    pricing_service = PricingService(
-        client=CardmarketClient(api_base_url="https://api.cardmarket.com/ws/v2.0/output.json", app_token="", app_secret=""),
-        repository=repository,
-        notifier=PopupNotifier(),
-    )
     pricing_service.seed_demo_data(dummy_item)
 
     app = create_app(pricing_service, watchlist_service)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import threading
 from datetime import datetime
 import pytest
 import requests
 
-from cardmarket_alert.api.client import CardmarketClient
+from cardmarket_alert.api.client import CardmarketClient, _compile_matcher
 from cardmarket_alert.models import PriceEntry, ProductFilter, WatchItem
 
 
@@ -17,6 +18,109 @@ def test_build_headers_returns_placeholder_dict(client: CardmarketClient) -> Non
     assert client.build_headers() == {}
 
 
+def test_client_reuses_pooled_session(client: CardmarketClient) -> None:
+    session = client._session
+
+    adapter = session.get_adapter("https://example.com")
+
+    assert isinstance(session, requests.Session)
+    assert adapter.max_retries.total == 3
+
+
+class DummyArticlesResponse:
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+    def raise_for_status(self) -> None:  # pragma: no cover - helper
+        return None
+
+
+def test_fetch_product_snapshot_parses_and_filters_articles(
+    monkeypatch: pytest.MonkeyPatch, client: CardmarketClient
+) -> None:
+    payload = (
+        b'{"article": ['
+        b'{"price": 4.5, "count": 2, "language": {"abbreviation": "EN"}, "condition": "NM", "seller": {"username": "b"}},'
+        b'{"price": {"value": "3.25"}, "count": 1, "language": {"languageName": "English"}, "condition": "nm"},'
+        b'{"price": 1.0, "count": 5, "language": "DE", "condition": "NM"},'
+        b'{"price": 2.0, "count": 0, "language": "EN", "condition": "NM"}'
+        b"]}"
+    )
+
+    def fake_get(
+        self: requests.Session, url: str, headers: dict, params: dict, timeout: int
+    ) -> DummyArticlesResponse:
+        assert url == "https://example.com/products/abc/articles"
+        assert params == {"minQuantity": 1, "language": "en", "condition": "NM"}
+        return DummyArticlesResponse(payload)
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    filters = ProductFilter(product_url="https://example.com/card", language="en", condition="NM")
+    item = WatchItem(product_id="abc", product_name="Alpha", filters=filters)
+
+    entries = client.fetch_product_snapshot(item)
+
+    assert [(entry.price_eur, entry.available_quantity, entry.seller) for entry in entries] == [(4.5, 2, "b")]
+
+
+def test_fetch_product_snapshot_signs_every_request(
+    monkeypatch: pytest.MonkeyPatch, client: CardmarketClient
+) -> None:
+    nonces = iter(range(100))
+    sent: list[dict] = []
+
+    def fake_get(
+        self: requests.Session, url: str, headers: dict, params: dict, timeout: int
+    ) -> DummyArticlesResponse:
+        sent.append(headers)
+        return DummyArticlesResponse(b"[]")
+
+    monkeypatch.setattr(CardmarketClient, "build_headers", lambda self: {"Authorization": f"nonce-{next(nonces)}"})
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    item = WatchItem(product_id="abc", product_name="Alpha", filters=ProductFilter(product_url="https://example.com"))
+
+    client.fetch_product_snapshot(item)
+    client.fetch_product_snapshot(item)
+
+    assert sent == [{"Authorization": "nonce-0"}, {"Authorization": "nonce-1"}]
+    assert "Authorization" not in client._session.headers
+
+
+def test_fetch_product_snapshot_returns_empty_on_malformed_json(
+    monkeypatch: pytest.MonkeyPatch, client: CardmarketClient
+) -> None:
+    def fake_get(
+        self: requests.Session, url: str, headers: dict, params: dict, timeout: int
+    ) -> DummyArticlesResponse:
+        return DummyArticlesResponse(b"{not json")
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    item = WatchItem(product_id="abc", product_name="Alpha", filters=ProductFilter(product_url="https://example.com"))
+
+    assert client.fetch_product_snapshot(item) == []
+
+
+def test_compile_matcher_only_checks_configured_filters() -> None:
+    assert _compile_matcher(ProductFilter(product_url="https://example.com")) is None
+
+    condition_only = _compile_matcher(ProductFilter(product_url="https://example.com", condition="NM"))
+    assert condition_only({"condition": "nm", "language": "DE"})
+    assert not condition_only({"language": "DE"})
+
+    both = _compile_matcher(ProductFilter(product_url="https://example.com", language="EN", condition="NM"))
+    assert both({"condition": "NM", "language": {"languageName": "en"}})
+    assert not both({"condition": "NM", "language": "DE"})
+
+
+def test_compile_matcher_follows_edited_filters() -> None:
+    filters = ProductFilter(product_url="https://example.com", language="EN")
+    filters.language = "DE"
+
+    matcher = _compile_matcher(filters)
+    assert matcher({"language": "de"})
+    assert not matcher({"language": "EN"})
+
+
 def test_fetch_bulk_snapshots_reuses_single_fetch(monkeypatch: pytest.MonkeyPatch, client: CardmarketClient) -> None:
     recorded: list[str] = []
 
@@ -35,7 +139,51 @@ def test_fetch_bulk_snapshots_reuses_single_fetch(monkeypatch: pytest.MonkeyPatc
     result = client.fetch_bulk_snapshots(items)
 
     assert result == {"abc": [], "def": []}
-    assert recorded == ["abc", "def"]
+    assert sorted(recorded) == ["abc", "def"]
+
+
+def test_fetch_bulk_snapshots_requests_each_product_once(
+    monkeypatch: pytest.MonkeyPatch, client: CardmarketClient
+) -> None:
+    recorded: list[str | None] = []
+
+    def fake_fetch(self: CardmarketClient, item: WatchItem) -> list[PriceEntry]:  # pragma: no cover - helper
+        recorded.append(item.filters.language)
+        return []
+
+    monkeypatch.setattr(CardmarketClient, "fetch_product_snapshot", fake_fetch)
+
+    items = [
+        WatchItem(product_id="abc", product_name="Alpha", filters=ProductFilter(product_url="u", language="EN")),
+        WatchItem(product_id="abc", product_name="Alpha", filters=ProductFilter(product_url="u", language="DE")),
+    ]
+
+    result = client.fetch_bulk_snapshots(items)
+
+    assert result == {"abc": []}
+    assert recorded == ["DE"]
+
+
+def test_fetch_bulk_snapshots_runs_requests_concurrently(
+    monkeypatch: pytest.MonkeyPatch, client: CardmarketClient
+) -> None:
+    barrier = threading.Barrier(2, timeout=2)
+
+    def fake_fetch(self: CardmarketClient, item: WatchItem) -> list[PriceEntry]:  # pragma: no cover - helper
+        barrier.wait()
+        return []
+
+    monkeypatch.setattr(CardmarketClient, "fetch_product_snapshot", fake_fetch)
+
+    filters = ProductFilter(product_url="https://example.com/card")
+    items = [
+        WatchItem(product_id="abc", product_name="Alpha", filters=filters),
+        WatchItem(product_id="def", product_name="Delta", filters=filters),
+    ]
+
+    result = client.fetch_bulk_snapshots(items)
+
+    assert list(result) == ["abc", "def"]
 
 
 def test_health_check_success(monkeypatch: pytest.MonkeyPatch, client: CardmarketClient) -> None:
@@ -43,12 +191,12 @@ def test_health_check_success(monkeypatch: pytest.MonkeyPatch, client: Cardmarke
         def raise_for_status(self) -> None:  # pragma: no cover - helper
             return None
 
-    def fake_get(url: str, timeout: int) -> DummyResponse:
+    def fake_get(self: requests.Session, url: str, timeout: int) -> DummyResponse:
         assert url == "https://example.com"
         assert timeout == 5
         return DummyResponse()
 
-    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(requests.Session, "get", fake_get)
 
     result = client.health_check()
 
@@ -57,10 +205,10 @@ def test_health_check_success(monkeypatch: pytest.MonkeyPatch, client: Cardmarke
 
 
 def test_health_check_failure(monkeypatch: pytest.MonkeyPatch, client: CardmarketClient) -> None:
-    def fake_get(url: str, timeout: int) -> None:  # pragma: no cover - helper
+    def fake_get(self: requests.Session, url: str, timeout: int) -> None:  # pragma: no cover - helper
         raise requests.RequestException("boom")
 
-    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(requests.Session, "get", fake_get)
 
     result = client.health_check()
 
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from cardmarket_alert.models import ProductFilter, WatchItem
+
+
+def test_watch_item_precomputes_name_sort_key() -> None:
+    item = WatchItem(product_id="demo", product_name="Demo", filters=ProductFilter(product_url="https://example.com"))
+
+    assert item.history.product_id == "demo"
+    assert item.name_sort_key == "demo"
+
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Iterable
+
+from cardmarket_alert.models import ProductFilter, WatchItem
+from cardmarket_alert.scheduler.poller import PollingScheduler
+
+
+def test_scheduler_runs_task_until_stopped() -> None:
+    item = WatchItem(product_id="demo", product_name="Demo", filters=ProductFilter(product_url="https://example.com"))
+    calls: list[list[WatchItem]] = []
+    ran_twice = threading.Event()
+
+    def task(items: Iterable[WatchItem]) -> None:
+        calls.append(list(items))
+        if len(calls) >= 2:
+            ran_twice.set()
+
+    scheduler = PollingScheduler(0.01, task)
+    scheduler.start([item])
+
+    assert ran_twice.wait(timeout=2)
+    scheduler.stop()
+    count_after_stop = len(calls)
+
+    time.sleep(0.05)
+
+    assert calls[0] == [item]
+    assert len(calls) <= count_after_stop + 1
+
+
+def test_scheduler_keeps_running_after_task_failure() -> None:
+    recovered = threading.Event()
+    attempts: list[int] = []
+
+    def task(items: Iterable[WatchItem]) -> None:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("boom")
+        recovered.set()
+
+    scheduler = PollingScheduler(0.01, task)
+    scheduler.start([])
+
+    assert recovered.wait(timeout=2)
+    scheduler.stop()
+
+
+def test_next_tick_keeps_fixed_rate_and_skips_missed_ticks() -> None:
+    scheduler = PollingScheduler(10, lambda items: None)
+
+    assert scheduler._next_tick(100.0, now=104.0) == 110.0
+    assert scheduler._next_tick(100.0, now=125.0) == 130.0
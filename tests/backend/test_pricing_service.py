@@ -74,3 +74,91 @@ def test_detect_price_movement_handles_empty_entries(tmp_path, watch_item: Watch
     alert = service._detect_price_movement(watch_item, [])
 
     assert alert is None
+
+
+def test_poll_watch_items_skips_already_persisted_snapshot(tmp_path, watch_item: WatchItem) -> None:
+    entries = [
+        PriceEntry(fetched_at=datetime.now(UTC), price_eur=12.5, available_quantity=4, seller="Seller"),
+    ]
+    client = DummyClient({"demo": entries})
+    repository = CsvPriceRepository(tmp_path)
+    notifier = RecordingNotifier()
+    service = PricingService(client=client, repository=repository, notifier=notifier)
+
+    service.poll_watch_items([watch_item])
+    service.poll_watch_items([watch_item])
+
+    assert repository.entry_count(watch_item) == 1
+    assert len(notifier.alerts) == 1
+
+
+def test_detect_price_movement_compares_cheapest_listing(tmp_path, watch_item: WatchItem) -> None:
+    fetched_at = datetime.now(UTC)
+    previous = PriceEntry(fetched_at=fetched_at, price_eur=10.0, available_quantity=1)
+    entries = [
+        PriceEntry(fetched_at=fetched_at, price_eur=10.0, available_quantity=2),
+        PriceEntry(fetched_at=fetched_at, price_eur=25.0, available_quantity=1),
+    ]
+    service = PricingService(client=DummyClient({}), repository=CsvPriceRepository(tmp_path), notifier=RecordingNotifier())
+
+    assert service._detect_price_movement(watch_item, entries, previous) is None
+
+
+def test_poll_watch_items_uses_cheapest_previous_listing(tmp_path, watch_item: WatchItem) -> None:
+    repository = CsvPriceRepository(tmp_path)
+    earlier = datetime(2024, 1, 1, tzinfo=UTC)
+    repository.append_entries(
+        watch_item,
+        [
+            PriceEntry(fetched_at=earlier, price_eur=8.0, available_quantity=1),
+            PriceEntry(fetched_at=earlier, price_eur=15.0, available_quantity=1),
+        ],
+    )
+    entries = [PriceEntry(fetched_at=datetime.now(UTC), price_eur=8.0, available_quantity=3)]
+    notifier = RecordingNotifier()
+    service = PricingService(client=DummyClient({"demo": entries}), repository=repository, notifier=notifier)
+
+    service.poll_watch_items([watch_item])
+
+    assert not notifier.alerts
+    assert repository.entry_count(watch_item) == 3
+
+
+def test_export_snapshot_refreshes_after_export(tmp_path, watch_item: WatchItem) -> None:
+    repository = CsvPriceRepository(tmp_path)
+    service = PricingService(client=DummyClient({}), repository=repository, notifier=RecordingNotifier())
+    repository.append_entries(
+        watch_item, [PriceEntry(fetched_at=datetime.now(UTC), price_eur=1.0, available_quantity=1)]
+    )
+    assert service.export_snapshot() == []
+
+    service.export_watch_item(watch_item)
+    first = service.export_snapshot()
+    assert [export["filename"] for export in first] == ["demo.csv"]
+
+    listing = repository.list_export_files()
+    assert repository.list_export_files() is listing
+
+    repository.append_entries(
+        watch_item, [PriceEntry(fetched_at=datetime.now(UTC), price_eur=2.0, available_quantity=1)]
+    )
+    service.export_watch_item(watch_item)
+
+    assert repository.list_export_files() is not listing
+    assert [export["filename"] for export in service.export_snapshot()] == ["demo.csv"]
+
+
+def test_export_snapshot_reuses_metadata_of_unchanged_exports(tmp_path, watch_item: WatchItem) -> None:
+    repository = CsvPriceRepository(tmp_path)
+    service = PricingService(client=DummyClient({}), repository=repository, notifier=RecordingNotifier())
+    other = WatchItem(product_id="other", product_name="Other", filters=watch_item.filters)
+    for item in (watch_item, other):
+        repository.append_entries(item, [PriceEntry(fetched_at=datetime.now(UTC), price_eur=1.0, available_quantity=1)])
+
+    service.export_watch_item(watch_item)
+    [demo_export] = service.export_snapshot()
+    service.export_watch_item(other)
+    exports = {export["filename"]: export for export in service.export_snapshot()}
+
+    assert set(exports) == {"demo.csv", "other.csv"}
+    assert exports["demo.csv"] is demo_export
@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import csv
+import io
+import shutil
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from cardmarket_alert.models import PriceEntry, ProductFilter, WatchItem
+from cardmarket_alert.storage.repository import CsvPriceRepository, _count_lines
+
+
+@pytest.fixture
+def watch_item() -> WatchItem:
+    filters = ProductFilter(product_url="https://example.com/card")
+    return WatchItem(product_id="demo", product_name="Demo", filters=filters)
+
+
+def make_entry(price: float, fetched_at: datetime | None = None, seller: str | None = "Seller") -> PriceEntry:
+    return PriceEntry(
+        fetched_at=fetched_at or datetime(2024, 1, 1, 12, 0, tzinfo=UTC),
+        price_eur=price,
+        available_quantity=2,
+        seller=seller,
+    )
+
+
+def test_append_entries_writes_header_once(tmp_path, watch_item: WatchItem) -> None:
+    repository = CsvPriceRepository(tmp_path)
+
+    repository.append_entries(watch_item, [make_entry(1.5)])
+    repository.append_entries(watch_item, [make_entry(2.5, seller=None)])
+
+    lines = repository.file_path_for(watch_item).read_text(encoding="utf-8").splitlines()
+    assert lines == [
+        "fetched_at,price_eur,available_quantity,seller",
+        "2024-01-01T12:00:00+00:00,1.5,2,Seller",
+        "2024-01-01T12:00:00+00:00,2.5,2,",
+    ]
+
+
+def test_existing_files_are_appended_without_new_header(tmp_path, watch_item: WatchItem) -> None:
+    CsvPriceRepository(tmp_path).append_entries(watch_item, [make_entry(1.5)])
+
+    repository = CsvPriceRepository(tmp_path)
+    repository.append_entries(watch_item, [make_entry(2.5)])
+
+    assert [entry.price_eur for entry in repository.load_history(watch_item)] == [1.5, 2.5]
+    assert repository.entry_count(watch_item) == 2
+
+
+def test_append_entries_quotes_sellers_like_csv_writer(tmp_path, watch_item: WatchItem) -> None:
+    repository = CsvPriceRepository(tmp_path)
+    entries = [make_entry(1.5, seller='Cards, "Mint" & More'), make_entry(2.0, seller=None)]
+
+    repository.append_entries(watch_item, entries)
+
+    expected = io.StringIO()
+    writer = csv.writer(expected)
+    writer.writerow(("fetched_at", "price_eur", "available_quantity", "seller"))
+    for entry in entries:
+        writer.writerow((entry.fetched_at.isoformat(), entry.price_eur, entry.available_quantity, entry.seller or ""))
+    assert repository.file_path_for(watch_item).read_bytes().decode("utf-8") == expected.getvalue()
+    assert CsvPriceRepository(tmp_path).load_history(watch_item)[0].seller == 'Cards, "Mint" & More'
+
+
+def test_append_after_file_deletion_rewrites_header(tmp_path, watch_item: WatchItem) -> None:
+    repository = CsvPriceRepository(tmp_path)
+    repository.append_entries(watch_item, [make_entry(1.5)])
+    repository.file_path_for(watch_item).unlink()
+
+    repository.append_entries(watch_item, [make_entry(2.5)])
+
+    fresh = CsvPriceRepository(tmp_path)
+    assert fresh.load_history(watch_item) == [make_entry(2.5)]
+    assert fresh.entry_count(watch_item) == 1
+
+
+def test_last_updated_reads_timestamp_from_file_tail(tmp_path, watch_item: WatchItem) -> None:
+    repository = CsvPriceRepository(tmp_path)
+    assert repository.last_updated(watch_item) is None
+
+    latest = datetime(2024, 3, 1, 8, 15, tzinfo=UTC)
+    repository.append_entries(watch_item, [make_entry(1.5), make_entry(2.5, fetched_at=latest, seller="x" * 10_000)])
+
+    assert repository.last_updated(watch_item) == latest
+
+
+def test_last_updated_ignores_header_only_file(tmp_path, watch_item: WatchItem) -> None:
+    repository = CsvPriceRepository(tmp_path)
+    repository.append_entries(watch_item, [])
+
+    assert repository.last_updated(watch_item) is None
+
+
+def test_latest_entry_and_count_follow_appends(tmp_path, watch_item: WatchItem) -> None:
+    repository = CsvPriceRepository(tmp_path)
+    assert repository.latest_entry(watch_item) is None
+    assert repository.entry_count(watch_item) == 0
+
+    repository.append_entries(watch_item, [make_entry(1.5), make_entry(2.5)])
+    assert repository.entry_count(watch_item) == 2
+
+    later = make_entry(3.5, fetched_at=datetime(2024, 2, 1, tzinfo=UTC))
+    repository.append_entries(watch_item, [later])
+
+    assert repository.latest_entry(watch_item) == later
+    assert repository.entry_count(watch_item) == 3
+
+
+def test_latest_entry_is_parsed_from_file_tail(tmp_path, watch_item: WatchItem) -> None:
+    CsvPriceRepository(tmp_path).append_entries(watch_item, [make_entry(1.5), make_entry(2.5, seller="A, B")])
+
+    repository = CsvPriceRepository(tmp_path)
+
+    assert repository.latest_entry(watch_item) == make_entry(2.5, seller="A, B")
+    assert repository.entry_count(watch_item) == 2
+
+
+def test_export_copies_history_to_export_directory(tmp_path, watch_item: WatchItem) -> None:
+    repository = CsvPriceRepository(tmp_path)
+    repository.append_entries(watch_item, [make_entry(1.5)])
+
+    target = repository.export(watch_item)
+
+    assert target == tmp_path / "exports" / "demo.csv"
+    assert target.read_bytes() == repository.file_path_for(watch_item).read_bytes()
+    assert repository.list_exports() == [target]
+
+
+def test_export_skips_copy_when_target_is_up_to_date(
+    tmp_path, watch_item: WatchItem, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repository = CsvPriceRepository(tmp_path)
+    repository.append_entries(watch_item, [make_entry(1.5)])
+    copies: list[Path] = []
+    copyfile = shutil.copyfile
+
+    def counting_copyfile(source: Path, target: Path) -> Path:
+        copies.append(target)
+        return copyfile(source, target)
+
+    monkeypatch.setattr(shutil, "copyfile", counting_copyfile)
+
+    target = repository.export(watch_item)
+    assert repository.export(watch_item) == target
+    assert len(copies) == 1
+
+    repository.append_entries(watch_item, [make_entry(2.5)])
+    repository.export(watch_item)
+
+    assert len(copies) == 2
+    assert target.read_bytes() == repository.file_path_for(watch_item).read_bytes()
+
+
+def test_list_exports_is_empty_when_export_directory_is_removed(tmp_path, watch_item: WatchItem) -> None:
+    repository = CsvPriceRepository(tmp_path)
+    repository.append_entries(watch_item, [make_entry(1.5)])
+    repository.export(watch_item)
+    assert repository.list_exports() == [tmp_path / "exports" / "demo.csv"]
+
+    shutil.rmtree(tmp_path / "exports")
+
+    assert repository.list_export_files() == []
+
+
+def test_export_without_history_raises(tmp_path, watch_item: WatchItem) -> None:
+    with pytest.raises(FileNotFoundError):
+        CsvPriceRepository(tmp_path).export(watch_item)
+
+
+def test_load_history_cache_tracks_appends_and_external_changes(tmp_path, watch_item: WatchItem) -> None:
+    repository = CsvPriceRepository(tmp_path)
+    repository.append_entries(watch_item, [make_entry(1.5)])
+    assert [entry.price_eur for entry in repository.load_history(watch_item)] == [1.5]
+
+    repository.append_entries(watch_item, [make_entry(2.5, seller="")])
+    history = repository.load_history(watch_item)
+    assert [entry.price_eur for entry in history] == [1.5, 2.5]
+    assert history[-1].seller is None
+
+    with repository.file_path_for(watch_item).open("a", encoding="utf-8") as handle:
+        handle.write("2024-01-02T00:00:00+00:00,3.5,1,External\n")
+
+    assert [entry.price_eur for entry in repository.load_history(watch_item)] == [1.5, 2.5, 3.5]
+    assert repository.latest_entry(watch_item).seller == "External"
+    assert repository.entry_count(watch_item) == 3
+    assert repository.load_history(watch_item, limit=1)[0].price_eur == 3.5
+
+
+def test_history_parsed_during_an_append_is_not_cached(tmp_path, watch_item: WatchItem) -> None:
+    CsvPriceRepository(tmp_path).append_entries(watch_item, [make_entry(1.5)])
+    repository = CsvPriceRepository(tmp_path)
+    parse_history = repository._parse_history
+    later = make_entry(2.5, datetime(2024, 1, 2, tzinfo=UTC))
+
+    def parse_then_append(file_path: Path, limit: int | None = None) -> list[PriceEntry]:
+        entries = parse_history(file_path, limit)
+        repository._parse_history = parse_history
+        repository.append_entries(watch_item, [later])  # lands while the reader is parsing
+        return entries
+
+    repository._parse_history = parse_then_append
+
+    assert repository.load_history(watch_item) == [make_entry(1.5)]
+    assert repository.load_history(watch_item) == [make_entry(1.5), later]
+    assert repository.entry_count(watch_item) == 2
+
+
+def test_load_history_limit_on_cold_cache_returns_newest_entries(tmp_path, watch_item: WatchItem) -> None:
+    CsvPriceRepository(tmp_path).append_entries(watch_item, [make_entry(1.5), make_entry(2.5), make_entry(3.5)])
+
+    repository = CsvPriceRepository(tmp_path)
+
+    assert [entry.price_eur for entry in repository.load_history(watch_item, limit=2)] == [2.5, 3.5]
+    assert [entry.price_eur for entry in repository.load_history(watch_item)] == [1.5, 2.5, 3.5]
+
+
+def test_load_history_zero_limit_is_empty_on_cold_and_warm_cache(tmp_path, watch_item: WatchItem) -> None:
+    CsvPriceRepository(tmp_path).append_entries(watch_item, [make_entry(1.5), make_entry(2.5)])
+    repository = CsvPriceRepository(tmp_path)
+
+    assert repository.load_history(watch_item, limit=0) == []
+    assert len(repository.load_history(watch_item)) == 2
+    assert repository.load_history(watch_item, limit=0) == []
+    assert repository.load_history(watch_item, limit=-1) == []
+
+
+def test_latest_snapshot_reads_only_the_file_tail(
+    tmp_path, watch_item: WatchItem, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first = datetime(2024, 1, 1, tzinfo=UTC)
+    second = datetime(2024, 1, 2, tzinfo=UTC)
+    writer = CsvPriceRepository(tmp_path)
+    writer.append_entries(watch_item, [make_entry(float(price), first) for price in range(500)])
+    writer.append_entries(watch_item, [make_entry(1.5, second), make_entry(2.5, second)])
+
+    repository = CsvPriceRepository(tmp_path)
+    monkeypatch.setattr(repository, "_parse_history", None)
+
+    assert repository.latest_snapshot(watch_item) == [make_entry(1.5, second), make_entry(2.5, second)]
+
+    third = datetime(2024, 1, 3, tzinfo=UTC)
+    repository.append_entries(watch_item, [make_entry(0.5, third)])
+    assert repository.latest_snapshot(watch_item) == [make_entry(0.5, third)]
+
+
+def test_latest_snapshot_spanning_many_blocks(tmp_path, watch_item: WatchItem) -> None:
+    entries = [make_entry(float(price), seller="A, B") for price in range(500)]
+    CsvPriceRepository(tmp_path).append_entries(watch_item, entries)
+
+    assert CsvPriceRepository(tmp_path).latest_snapshot(watch_item) == entries
+
+
+def test_entry_count_counts_rows_without_trailing_newline(tmp_path, watch_item: WatchItem) -> None:
+    CsvPriceRepository(tmp_path).append_entries(watch_item, [make_entry(1.5), make_entry(2.5)])
+    with (tmp_path / "demo.csv").open("a", encoding="utf-8") as handle:
+        handle.write("2024-01-02T00:00:00+00:00,3.5,1,External")
+
+    assert CsvPriceRepository(tmp_path).entry_count(watch_item) == 3
+
+
+def test_entry_count_ignores_newlines_inside_quoted_sellers(tmp_path, watch_item: WatchItem) -> None:
+    repository = CsvPriceRepository(tmp_path)
+    entries = [make_entry(1.5, seller="Shop\nBerlin"), make_entry(2.5, seller='Say "hi",\r\nthere')]
+    repository.append_entries(watch_item, entries)
+    assert repository.entry_count(watch_item) == 2
+
+    assert _count_lines(repository.file_path_for(watch_item), chunk_size=7) == 3
+    cold = CsvPriceRepository(tmp_path)
+    assert cold.entry_count(watch_item) == 2
+    assert cold.latest_entry(watch_item) == entries[-1]
+
+
+def test_entry_count_treats_mid_field_quotes_as_literal(tmp_path, watch_item: WatchItem) -> None:
+    repository = CsvPriceRepository(tmp_path)
+    file_path = repository.file_path_for(watch_item)
+    file_path.write_text(
+        "fetched_at,price_eur,available_quantity,seller\r\n"
+        '2024-01-01T00:00:00+00:00,1.0,1,Joe"s\r\n'
+        '2024-01-01T00:00:00+00:00,2.0,1,"Shop\nBerlin"\r\n'
+        '2024-01-01T00:00:00+00:00,3.0,1,"Say ""hi"""\r\n',
+        encoding="utf-8",
+        newline="",
+    )
+
+    assert len(repository.load_history(watch_item)) == 3
+    assert repository.entry_count(watch_item) == 3
+    for chunk_size in (1, 5, 16):
+        assert _count_lines(file_path, chunk_size=chunk_size) == 4
+
+
+def test_stat_meta_summarises_history(tmp_path, watch_item: WatchItem) -> None:
+    repository = CsvPriceRepository(tmp_path)
+    assert repository.stat_meta(watch_item) == (False, 0, [])
+
+    latest = make_entry(2.5, fetched_at=datetime(2024, 2, 1, tzinfo=UTC))
+    repository.append_entries(watch_item, [make_entry(1.5), latest])
+
+    assert CsvPriceRepository(tmp_path).stat_meta(watch_item) == (True, 2, [latest])
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+
+from cardmarket_alert.api.cache import (
+    CachedCardmarketClient,
+    CachedSnapshot,
+    InMemorySnapshotCache,
+    LocalSnapshotCache,
+)
+from cardmarket_alert.api.client import CardmarketClient
+from cardmarket_alert.models import PriceEntry, ProductFilter, WatchItem
+
+
+@pytest.fixture
+def watch_item() -> WatchItem:
+    filters = ProductFilter(product_url="https://example.com/card", language="EN")
+    return WatchItem(product_id="abc", product_name="Alpha", filters=filters)
+
+
+@pytest.fixture
+def upstream(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+
+    def fake_fetch(self: CardmarketClient, item: WatchItem) -> list[PriceEntry]:  # pragma: no cover - helper
+        calls.append(item.product_id)
+        return [PriceEntry(fetched_at=datetime.now(UTC), price_eur=1.5, available_quantity=2)]
+
+    monkeypatch.setattr(CardmarketClient, "fetch_product_snapshot", fake_fetch)
+    return calls
+
+
+def make_client(cache: InMemorySnapshotCache) -> CachedCardmarketClient:
+    return CachedCardmarketClient(
+        api_base_url="https://example.com",
+        app_token="token",
+        app_secret="secret",
+        cache=cache,
+        ttl_seconds=60,
+    )
+
+
+def test_cache_key_includes_filters(watch_item: WatchItem) -> None:
+    assert CachedCardmarketClient.cache_key(watch_item) == "cm:v1:snapshot:abc:EN:None:1"
+
+
+def test_fresh_snapshot_is_served_from_cache(upstream: list[str], watch_item: WatchItem) -> None:
+    client = make_client(InMemorySnapshotCache())
+
+    first = client.fetch_product_snapshot(watch_item)
+    second = client.fetch_product_snapshot(watch_item)
+
+    assert upstream == ["abc"]
+    assert first == second
+
+
+def test_stale_snapshot_is_served_while_another_caller_refreshes(
+    upstream: list[str], watch_item: WatchItem
+) -> None:
+    cache = InMemorySnapshotCache()
+    client = make_client(cache)
+    key = client.cache_key(watch_item)
+    stale = [PriceEntry(fetched_at=datetime(2024, 1, 1, tzinfo=UTC), price_eur=9.0, available_quantity=1)]
+    cache.set(key, CachedSnapshot(fresh_until=0.0, entries=stale), 60)
+    assert cache.add(f"{key}:lock", True, 60)
+
+    assert client.fetch_product_snapshot(watch_item) == stale
+    assert upstream == []
+
+
+def test_local_tier_is_consulted_before_shared_cache(upstream: list[str], watch_item: WatchItem) -> None:
+    cache = InMemorySnapshotCache()
+    client = make_client(cache)
+
+    client.fetch_product_snapshot(watch_item)
+    cache.delete(client.cache_key(watch_item))
+    client.fetch_product_snapshot(watch_item)
+
+    assert upstream == ["abc"]
+
+
+def test_local_snapshot_cache_evicts_least_recently_used() -> None:
+    cache = LocalSnapshotCache(maxsize=2, ttl_seconds=60)
+    cache.set("a", [])
+    cache.set("b", [])
+    cache.get("a")
+
+    cache.set("c", [])
+
+    assert cache.get("a") == []
+    assert cache.get("b") is None
+    assert cache.get("c") == []
+
+
+def test_in_memory_cache_add_only_sets_missing_keys() -> None:
+    cache = InMemorySnapshotCache()
+
+    assert cache.add("lock", True, 60)
+    assert not cache.add("lock", True, 60)
+
+    cache.delete("lock")
+    assert cache.add("lock", True, 60)
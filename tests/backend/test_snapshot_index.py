@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from cardmarket_alert.models import PriceEntry, ProductFilter, WatchItem
+from cardmarket_alert.services.snapshot_index import WatchlistSnapshotIndex
+from cardmarket_alert.services.watchlist_service import WatchlistService
+from cardmarket_alert.storage.repository import CsvPriceRepository
+
+
+def make_entry(price: float, minute: int = 0) -> PriceEntry:
+    return PriceEntry(fetched_at=datetime(2024, 1, 1, 12, minute, tzinfo=UTC), price_eur=price, available_quantity=1)
+
+
+def test_index_tracks_appends_without_rereading_files(tmp_path) -> None:
+    repository = CsvPriceRepository(tmp_path)
+    index = WatchlistSnapshotIndex(repository)
+    watchlist = WatchlistService(snapshot_index=index)
+    item = watchlist.add_item("demo", "Demo", ProductFilter(product_url="https://example.com/card"))
+
+    [empty] = index.snapshot([item])
+    assert empty["entry_count"] == 0
+    assert not empty["has_history"]
+
+    repository.append_entries(item, [make_entry(4.0), make_entry(3.5, minute=1)])
+    repository.file_path_for(item).unlink()
+
+    [record] = index.snapshot([item])
+    assert record["entry_count"] == 2
+    assert record["latest_price"] == 3.5
+    assert record["last_updated"] == datetime(2024, 1, 1, 12, 1, tzinfo=UTC)
+
+
+def test_index_follows_watchlist_changes(tmp_path) -> None:
+    repository = CsvPriceRepository(tmp_path)
+    index = WatchlistSnapshotIndex(repository)
+    watchlist = WatchlistService(snapshot_index=index)
+    item = watchlist.add_item("demo", "Demo", ProductFilter(product_url="https://example.com/card"))
+    repository.append_entries(item, [make_entry(4.0)])
+
+    watchlist.remove_item("demo")
+    repository.append_entries(item, [make_entry(5.0, minute=1)])
+    replacement = WatchItem(product_id="demo", product_name="Demo", filters=item.filters)
+    watchlist.load([replacement])
+
+    [record] = index.snapshot(watchlist.all_items())
+    assert record["item"] is replacement
+    assert record["entry_count"] == 2
+    assert record["latest_price"] == 5.0
+
+
+def test_snapshot_builds_missing_records_in_order(tmp_path) -> None:
+    repository = CsvPriceRepository(tmp_path)
+    index = WatchlistSnapshotIndex(repository)
+    filters = ProductFilter(product_url="https://example.com/card")
+    items = [WatchItem(product_id=f"card-{number}", product_name=f"Card {number}", filters=filters) for number in range(5)]
+    for number, item in enumerate(items):
+        repository.append_entries(item, [make_entry(float(number))] * (number + 1))
+
+    snapshot = index.snapshot(items)
+
+    assert [record["item"] for record in snapshot] == items
+    assert [record["entry_count"] for record in snapshot] == [1, 2, 3, 4, 5]
+
+
+def test_index_reports_cheapest_listing_of_latest_snapshot(tmp_path) -> None:
+    repository = CsvPriceRepository(tmp_path)
+    item = WatchItem(product_id="demo", product_name="Demo", filters=ProductFilter(product_url="https://example.com"))
+    repository.append_entries(item, [make_entry(2.0), make_entry(6.0)])
+    index = WatchlistSnapshotIndex(repository)
+
+    [cold] = index.snapshot([item])
+    repository.append_entries(item, [make_entry(3.0, minute=1), make_entry(5.0, minute=1)])
+    [warm] = index.snapshot([item])
+
+    assert cold["latest_price"] == 2.0
+    assert warm["latest_price"] == 3.0
+    assert warm["entry_count"] == 4
+
+
+def test_record_built_during_an_append_is_rebuilt(tmp_path) -> None:
+    repository = CsvPriceRepository(tmp_path)
+    item = WatchItem(product_id="demo", product_name="Demo", filters=ProductFilter(product_url="https://example.com"))
+    repository.append_entries(item, [make_entry(4.0)])
+    index = WatchlistSnapshotIndex(repository)
+    stat_meta = repository.stat_meta
+    later = PriceEntry(fetched_at=datetime(2025, 1, 1, tzinfo=UTC), price_eur=3.0, available_quantity=1)
+
+    def stat_meta_then_append(watch_item: WatchItem):
+        result = stat_meta(watch_item)
+        repository.stat_meta = stat_meta
+        repository.append_entries(watch_item, [later])  # lands while the record is built
+        return result
+
+    repository.stat_meta = stat_meta_then_append
+
+    [record] = index.snapshot([item])
+
+    assert record["entry_count"] == 2
+    assert record["last_updated"] == later.fetched_at
+
+
+def test_record_built_during_a_removal_is_dropped(tmp_path) -> None:
+    repository = CsvPriceRepository(tmp_path)
+    item = WatchItem(product_id="demo", product_name="Demo", filters=ProductFilter(product_url="https://example.com"))
+    repository.append_entries(item, [make_entry(4.0)])
+    index = WatchlistSnapshotIndex(repository)
+    stat_meta = repository.stat_meta
+
+    def stat_meta_then_remove(watch_item: WatchItem):
+        result = stat_meta(watch_item)
+        repository.stat_meta = stat_meta
+        index.remove(watch_item.product_id)  # lands while the record is built
+        return result
+
+    repository.stat_meta = stat_meta_then_remove
+
+    assert index.snapshot([item]) == []
+    repository.append_entries(item, [make_entry(3.0, minute=1)])
+    [record] = index.snapshot([item])
+    assert record["entry_count"] == 2
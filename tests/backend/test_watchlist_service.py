@@ -48,3 +48,18 @@ def test_load_replaces_existing_items() -> None:
 
     assert list(service.items) == ["abc"]
     assert service.items["abc"].product_name == "Alpha"
+
+
+def test_all_items_sorted_follows_adds_and_removes() -> None:
+    service = WatchlistService()
+    filters = ProductFilter(product_url="https://example.com/card")
+
+    charizard = service.add_item("c", "charizard", filters)
+    service.add_item("a", "Blue-Eyes", filters)
+    alpha = service.add_item("b", "alpha", filters)
+    renamed = service.add_item("a", "Dark Magician", filters)
+
+    assert service.all_items_sorted() == (alpha, charizard, renamed)
+
+    service.remove_item("c")
+    assert service.all_items_sorted() == (alpha, renamed)